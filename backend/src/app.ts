@@ -87,6 +87,41 @@ app.use(express.urlencoded({ extended: true }));
 app.use(requestLogger);
 app.use(shutdownHeaderMiddleware);
 
+/**
+ * Coarse "now" for health/status payloads: the ISO string is reused for up to 100ms
+ * so high-frequency probes don't format a fresh timestamp on every hit
+ */
+const TIMESTAMP_CACHE_MS = 100;
+let cachedTimestampAt = 0;
+let cachedTimestamp = '';
+
+function coarseTimestamp(): string {
+  const now = Date.now();
+  if (now - cachedTimestampAt >= TIMESTAMP_CACHE_MS) {
+    cachedTimestampAt = now;
+    cachedTimestamp = new Date(now).toISOString();
+  }
+  return cachedTimestamp;
+}
+
+/**
+ * Memory snapshot for /api/status, refreshed at most once per second.
+ * process.memoryUsage() walks heap stats and reads RSS from the OS, which is the
+ * expensive part of a status poll; uptime and shutdown state stay live.
+ */
+const MEMORY_USAGE_CACHE_MS = 1_000;
+let cachedMemoryUsageAt = 0;
+let cachedMemoryUsage: NodeJS.MemoryUsage | null = null;
+
+function recentMemoryUsage(): NodeJS.MemoryUsage {
+  const now = Date.now();
+  if (!cachedMemoryUsage || now - cachedMemoryUsageAt >= MEMORY_USAGE_CACHE_MS) {
+    cachedMemoryUsageAt = now;
+    cachedMemoryUsage = process.memoryUsage();
+  }
+  return cachedMemoryUsage;
+}
+
 /**
  * API Routes
  */
@@ -103,7 +138,7 @@ app.get('/api/health', (req: Request, res: Response) => {
     status: 'ok',
     service: 'DotBot Backend',
     environment: NODE_ENV,
-    timestamp: new Date().toISOString()
+    timestamp: coarseTimestamp()
   });
 });
 
@@ -111,10 +146,10 @@ app.get('/api/status', (req: Request, res: Response) => {
   res.json({
     status: 'running',
     uptime: process.uptime(),
-    memory: process.memoryUsage(),
+    memory: recentMemoryUsage(),
     environment: NODE_ENV,
     goingDown: isBackendGoingDown(),
-    timestamp: new Date().toISOString()
+    timestamp: coarseTimestamp()
   });
 });
 app.use('/api/internal', shutdownNoticeRouter);
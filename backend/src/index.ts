@@ -33,6 +33,13 @@ try {
 // Create HTTP server (needed for Socket.IO)
 const httpServer = createServer(app);
 
+// Keep idle client connections open longer than typical reverse proxy / load balancer idle
+// timeouts (often 60s). Node's 5s default makes the proxy reuse sockets we already closed,
+// forcing reconnects (and resets) instead of reusing warm keep-alive connections.
+// headersTimeout must stay above keepAliveTimeout.
+httpServer.keepAliveTimeout = 65_000;
+httpServer.headersTimeout = 66_000;
+
 // Initialize WebSocket Manager
 const wsManager = new WebSocketManager({
   httpServer,
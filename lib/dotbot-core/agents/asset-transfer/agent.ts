@@ -21,6 +21,7 @@ import {
   buildSafeBatchExtrinsic,
 } from './utils/safeExtrinsicBuilder';
 import {
+  validateAddress,
   validateTransferAddresses,
   validateSenderAddress,
   validateSenderAddressForSigning,
@@ -103,7 +104,7 @@ export class AssetTransferAgent extends BaseAgent {
       this.validateTransfersArray(params.transfers);
 
       const context = await this.prepareBatchContext(params);
-      const { validatedTransfers, totalAmount } = this.validateAndParseTransfersWithCapabilities(
+      const { validatedTransfers, transfersWithBN, totalAmount } = this.validateAndParseTransfersWithCapabilities(
         params.address,
         params.transfers,
         context.capabilities
@@ -122,11 +123,6 @@ export class AssetTransferAgent extends BaseAgent {
         params.validateBalance !== false
       );
       
-      const transfersWithBN = validatedTransfers.map(t => ({
-        recipient: t.recipient,
-        amount: new BN(t.amount),
-      }));
-      
       const result = buildSafeBatchExtrinsic(
         context.targetApi,
         transfersWithBN,
@@ -336,7 +332,8 @@ export class AssetTransferAgent extends BaseAgent {
     }
   ): AgentResult {
     const allWarnings = [...context.warnings, ...extrinsicResult.warnings];
-    const description = `Transfer ${formatAmount(extrinsicResult.amountBN, context.capabilities.nativeDecimals)} ${context.capabilities.nativeTokenSymbol} from ${context.senderAddress.slice(0, 8)}...${context.senderAddress.slice(-8)} to ${extrinsicResult.recipientEncoded.slice(0, 8)}...${extrinsicResult.recipientEncoded.slice(-8)} on ${context.chainName}`;
+    const formattedAmount = formatAmount(extrinsicResult.amountBN, context.capabilities.nativeDecimals);
+    const description = `Transfer ${formattedAmount} ${context.capabilities.nativeTokenSymbol} from ${context.senderAddress.slice(0, 8)}...${context.senderAddress.slice(-8)} to ${extrinsicResult.recipientEncoded.slice(0, 8)}...${extrinsicResult.recipientEncoded.slice(-8)} on ${context.chainName}`;
 
     return this.createResult(
       description,
@@ -354,7 +351,7 @@ export class AssetTransferAgent extends BaseAgent {
           sender: context.senderAddress,
           recipient: extrinsicResult.recipientEncoded,
           keepAlive: context.keepAlive ?? false,
-          formattedAmount: formatAmount(extrinsicResult.amountBN, context.capabilities.nativeDecimals),
+          formattedAmount,
         },
         resultType: 'extrinsic',
         requiresConfirmation: true,
@@ -376,10 +373,16 @@ export class AssetTransferAgent extends BaseAgent {
     senderAddress: string,
     transfers: Array<{ recipient: string; amount: string | number }>,
     capabilities: TransferCapabilities
-  ): { validatedTransfers: Array<{ recipient: string; amount: string }>; totalAmount: BN } {
+  ): {
+    validatedTransfers: Array<{ recipient: string; amount: string }>;
+    transfersWithBN: Array<{ recipient: string; amount: BN }>;
+    totalAmount: BN;
+  } {
     const totalAmount = new BN(0);
+    // Keep the parsed BN next to its string form so the extrinsic builder doesn't re-parse it
+    const transfersWithBN: Array<{ recipient: string; amount: BN }> = [];
     const validatedTransfers = transfers.map((transfer, index) => {
-      const recipientValidation = this.validateAddress(transfer.recipient);
+      const recipientValidation = validateAddress(transfer.recipient);
       if (!recipientValidation.valid) {
         throw new AgentError(
           `Invalid recipient address at index ${index}: ${recipientValidation.errors.join(', ')}`,
@@ -398,6 +401,7 @@ export class AssetTransferAgent extends BaseAgent {
 
       const amountBN = parseAndValidateAmountWithCapabilities(transfer.amount, capabilities, index);
       totalAmount.iadd(amountBN);
+      transfersWithBN.push({ recipient: transfer.recipient, amount: amountBN });
 
       return {
         recipient: transfer.recipient,
@@ -405,7 +409,7 @@ export class AssetTransferAgent extends BaseAgent {
       };
     });
 
-    return { validatedTransfers, totalAmount };
+    return { validatedTransfers, transfersWithBN, totalAmount };
   }
 
   private async prepareBatchContext(
@@ -12,6 +12,35 @@ export interface AddressValidationResult {
   errors: string[];
 }
 
+/** Upper bound on remembered valid addresses; oldest entries are evicted first */
+const VALID_ADDRESS_CACHE_SIZE = 4096;
+
+/**
+ * Addresses that already passed SS58 decode + checksum verification.
+ * Addresses are immutable, so a hit can skip the decode entirely. Only valid
+ * addresses are remembered so arbitrary bad input cannot crowd the cache.
+ */
+const validAddressCache = new Set<string>();
+
+function rememberValidAddress(address: string): void {
+  // Re-insert to move the address to the most-recently-used end
+  validAddressCache.delete(address);
+  validAddressCache.add(address);
+  if (validAddressCache.size > VALID_ADDRESS_CACHE_SIZE) {
+    const oldest = validAddressCache.values().next().value;
+    if (oldest !== undefined) {
+      validAddressCache.delete(oldest);
+    }
+  }
+}
+
+/**
+ * Forget all cached address validations (mainly for tests)
+ */
+export function clearAddressValidationCache(): void {
+  validAddressCache.clear();
+}
+
 /**
  * Validate a single address
  */
@@ -23,6 +52,11 @@ export function validateAddress(address: string): AddressValidationResult {
     return { valid: false, errors };
   }
 
+  if (validAddressCache.has(address)) {
+    rememberValidAddress(address);
+    return { valid: true, errors: [] };
+  }
+
   try {
     if (!isAddress(address)) {
       errors.push(`Invalid address format: ${address}`);
@@ -35,6 +69,7 @@ export function validateAddress(address: string): AddressValidationResult {
     return { valid: false, errors };
   }
 
+  rememberValidAddress(address);
   return { valid: true, errors: [] };
 }
 
@@ -88,8 +123,6 @@ export function validateSenderAddress(address: string): void {
  * exactly, otherwise the signature won't validate.
  */
 export async function validateSenderAddressForSigning(address: string): Promise<void> {
-  const { decodeAddress } = await import('@polkadot/util-crypto');
-  
   try {
     decodeAddress(address);
   } catch (error) {
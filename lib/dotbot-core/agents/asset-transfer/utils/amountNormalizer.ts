@@ -7,7 +7,7 @@
 
 import { BN } from '@polkadot/util';
 import { TransferCapabilities } from './transferCapabilities';
-import { integerAmountToPlanck } from './amountParser';
+import { integerAmountToPlanck, planckMultiplier } from './amountParser';
 
 /**
  * Normalize amount to BN (Planck), handling different input formats.
@@ -46,10 +46,9 @@ export function normalizeAmountToBN(
         );
       }
 
-      const multiplier = new BN(10).pow(new BN(capabilities.nativeDecimals));
-      const wholeBN = new BN(whole || '0').mul(multiplier);
+      const wholeBN = new BN(whole || '0').mul(planckMultiplier(capabilities.nativeDecimals));
       const decimalBN = new BN(decimal).mul(
-        new BN(10).pow(new BN(capabilities.nativeDecimals - decimalPlaces))
+        planckMultiplier(capabilities.nativeDecimals - decimalPlaces)
       );
 
       return wholeBN.add(decimalBN);
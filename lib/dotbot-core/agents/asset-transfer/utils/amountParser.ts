@@ -9,6 +9,22 @@ import { BN } from '@polkadot/util';
 import { TransferCapabilities } from './transferCapabilities';
 import { AgentError } from '../../types';
 
+const planckMultipliers = new Map<number, BN>();
+
+/**
+ * 10^decimals as a BN, computed once per decimals value.
+ * Chains only ever use a handful of decimals, so the amount hot path skips the repeated pow.
+ * The returned BN is shared: use non-mutating ops (mul/div/mod), never the in-place i* variants.
+ */
+export function planckMultiplier(decimals: number): BN {
+  let multiplier = planckMultipliers.get(decimals);
+  if (!multiplier) {
+    multiplier = new BN(10).pow(new BN(decimals));
+    planckMultipliers.set(decimals, multiplier);
+  }
+  return multiplier;
+}
+
 /**
  * Convert an integer amount (string or number) from human token units to Planck.
  * User/LLM always use token units (DOT, KSM, etc.); they never pass raw Planck unless explicitly specified.
@@ -16,7 +32,7 @@ import { AgentError } from '../../types';
  */
 export function integerAmountToPlanck(value: string | number, decimals: number): BN {
   const whole = typeof value === 'number' ? new BN(value) : new BN(value);
-  const multiplier = new BN(10).pow(new BN(decimals));
+  const multiplier = planckMultiplier(decimals);
   return whole.mul(multiplier);
 }
 
@@ -58,7 +74,7 @@ export function parseAmount(amount: string | number, decimals = 10): BN {
   const fractionPadded = fraction.padEnd(decimals, '0').slice(0, decimals);
   const wholeBN = new BN(whole || '0');
   const fractionBN = new BN(fractionPadded || '0');
-  const divisor = new BN(10).pow(new BN(decimals));
+  const divisor = planckMultiplier(decimals);
   return wholeBN.mul(divisor).add(fractionBN);
 }
 
@@ -81,7 +97,7 @@ export function formatAmount(amountBN: BN, decimals?: number): string {
     console.warn('[formatAmount] No decimals provided, defaulting to 10. This may be incorrect for Kusama/Westend!');
     decimals = 10;
   }
-  const divisor = new BN(10).pow(new BN(decimals));
+  const divisor = planckMultiplier(decimals);
   const whole = amountBN.div(divisor).toString();
   const fraction = amountBN.mod(divisor).toString().padStart(decimals, '0');
   
@@ -47,7 +47,7 @@ import { startExecution as startExecutionImpl, startExecutionStateless as startE
 import { ensureRpcConnectionsReady as ensureRpcConnectionsReadyImpl } from './dotbot/rpcLifecycle';
 import { initializeChatInstance as initializeChatInstanceImpl, clearHistory as clearHistoryImpl, switchEnvironment as switchEnvironmentImpl, loadChatInstance as loadChatInstanceImpl } from './dotbot/chatLifecycle';
 import { getLLMResponse as getLLMResponseImpl } from './dotbot/llm';
-import { getBalance as getBalanceImpl, getChainInfo as getChainInfoImpl } from './dotbot/balanceChain';
+import { getBalance as getBalanceImpl, getChainInfo as getChainInfoImpl, type BalanceSummary } from './dotbot/balanceChain';
 import type { DotBotConfig, ChatResult, ChatOptions, ConversationMessage, DotBotEvent, DotBotEventListener } from './dotbot/types';
 import { DotBotEventType } from './dotbot/types';
 
@@ -103,6 +103,9 @@ export class DotBot {
   private executionArrays: Map<string, ExecutionArray> = new Map();
 
   private readonly SESSION_TTL_MS = 15 * 60 * 1000;
+
+  // Short-lived getBalance() results keyed by `${network}:${address}` (see dotbot/balanceChain)
+  private balanceCache: Map<string, { fetchedAt: number; balance: BalanceSummary }> = new Map();
   
   // Event emitter for external observers (e.g., ScenarioEngine)
   private eventListeners: Set<DotBotEventListener> = new Set();
@@ -467,11 +470,7 @@ export class DotBot {
   /** REMOVED: executeWithArrayTracking — use prepareExecution(plan) then startExecution(executionId). For CLI, use ExecutionSystem directly. */
 
   /** Relay + asset hub balance (free/reserved/frozen) and total free. */
-  async getBalance(): Promise<{
-    relayChain: { free: string; reserved: string; frozen: string };
-    assetHub: { free: string; reserved: string; frozen: string } | null;
-    total: string;
-  }> {
+  async getBalance(): Promise<BalanceSummary> {
     return getBalanceImpl(this);
   }
 
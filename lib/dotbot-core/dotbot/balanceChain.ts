@@ -2,8 +2,19 @@
  * Balance and chain: relay + asset hub balance, chain/version.
  */
 
+import { BALANCE_CACHE_TTL_MS } from './constants';
+
 type DotBotInstance = any;
 
+type AccountBalance = { free: string; reserved: string; frozen: string };
+
+/** Result of getBalance(): relay + asset hub balance and total free. */
+export type BalanceSummary = {
+  relayChain: AccountBalance;
+  assetHub: AccountBalance | null;
+  total: string;
+};
+
 /** Extract free/reserved/frozen from system.account response (handles varying runtime shapes). RPC may return numbers (e.g. 0) or strings; we always return string. */
 function parseAccountData(raw: unknown): { free: string; reserved: string; frozen: string } {
   const obj = raw && typeof raw === 'object' ? (raw as Record<string, unknown>) : null;
@@ -17,12 +28,8 @@ function parseAccountData(raw: unknown): { free: string; reserved: string; froze
   return { free, reserved, frozen };
 }
 
-/** Relay + asset hub balance (free/reserved/frozen) and total free. */
-export async function getBalance(dotbot: DotBotInstance): Promise<{
-  relayChain: { free: string; reserved: string; frozen: string };
-  assetHub: { free: string; reserved: string; frozen: string } | null;
-  total: string;
-}> {
+/** Relay + asset hub balance (free/reserved/frozen) and total free. Reused for BALANCE_CACHE_TTL_MS per network + address. */
+export async function getBalance(dotbot: DotBotInstance): Promise<BalanceSummary> {
   await dotbot.ensureRpcConnectionsReady();
   const address = dotbot.wallet?.address ?? '';
   if (!address) {
@@ -34,32 +41,51 @@ export async function getBalance(dotbot: DotBotInstance): Promise<{
     };
   }
 
-  const relayAccountInfo = await dotbot.api!.query.system.account(address);
-  const relayRaw = relayAccountInfo.toJSON();
-  const relayBalance = parseAccountData(relayRaw);
+  const cacheKey = `${dotbot.network}:${address}`;
+  const cached = dotbot.balanceCache?.get(cacheKey);
+  if (cached && Date.now() - cached.fetchedAt < BALANCE_CACHE_TTL_MS) {
+    return cached.balance;
+  }
 
-  let assetHubBalance: { free: string; reserved: string; frozen: string } | null = null;
   if (!dotbot.assetHubApi) {
     dotbot.rpcLogger?.warn?.(
       { network: dotbot.network },
       'getBalance: Asset Hub not connected — balance will be relay-only. Check backend RPC logs for Asset Hub connection errors.'
     );
   }
-  if (dotbot.assetHubApi) {
+  const fetchAssetHubBalance = async (): Promise<AccountBalance | null> => {
+    if (!dotbot.assetHubApi) return null;
     try {
       const assetHubAccountInfo = await dotbot.assetHubApi.query.system.account(address);
-      const assetHubRaw = assetHubAccountInfo.toJSON();
-      assetHubBalance = parseAccountData(assetHubRaw);
+      return parseAccountData(assetHubAccountInfo.toJSON());
     } catch (err) {
       dotbot.rpcLogger?.debug?.(
         { error: err instanceof Error ? err.message : String(err) },
         'Failed to fetch Asset Hub balance'
       );
+      return null;
     }
-  }
+  };
+
+  // Independent chains: query both at once so latency is max(relay, asset hub), not the sum
+  const [relayAccountInfo, assetHubBalance] = await Promise.all([
+    dotbot.api!.query.system.account(address),
+    fetchAssetHubBalance(),
+  ]);
+  const relayBalance = parseAccountData(relayAccountInfo.toJSON());
 
   const totalFree = BigInt(relayBalance.free) + (assetHubBalance ? BigInt(assetHubBalance.free) : BigInt(0));
-  return { relayChain: relayBalance, assetHub: assetHubBalance, total: totalFree.toString() };
+  const balance: BalanceSummary = { relayChain: relayBalance, assetHub: assetHubBalance, total: totalFree.toString() };
+  // Don't pin a relay-only answer: Asset Hub may have errored or not be connected yet (retried when needed)
+  if (assetHubBalance) {
+    dotbot.balanceCache?.set(cacheKey, { fetchedAt: Date.now(), balance });
+  }
+  return balance;
+}
+
+/** Drop cached balances (call after anything that may have moved funds, e.g. an execution). */
+export function invalidateBalanceCache(dotbot: DotBotInstance): void {
+  dotbot.balanceCache?.clear();
 }
 
 /** Chain name and runtime version from relay RPC. */
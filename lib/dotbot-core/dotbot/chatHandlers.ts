@@ -10,6 +10,9 @@ import type { ChatResult, ChatOptions } from './types';
 
 type DotBotInstance = any;
 
+/** Opening/closing code fences (optionally ```json) plus trailing whitespace, stripped in one pass. */
+const CODE_FENCE_PATTERN = /```(?:json)?\s*/g;
+
 /** Handle a text-only reply: strip code fences, append to chat, optionally refresh title. */
 export async function handleConversationResponse(
   dotbot: DotBotInstance,
@@ -19,10 +22,7 @@ export async function handleConversationResponse(
     dotbot.currentChat.setExecution(null);
   }
 
-  const cleanedResponse = llmResponse
-    .replace(/```json\s*/g, '')
-    .replace(/```\s*/g, '')
-    .trim();
+  const cleanedResponse = llmResponse.replace(CODE_FENCE_PATTERN, '').trim();
 
   if (dotbot.currentChat) {
     await dotbot.currentChat.addBotMessage(cleanedResponse);
@@ -141,9 +141,10 @@ export async function loadChatInstance(dotbot: DotBotInstance, chatId: string):
   }
   dotbot.currentChat = new ChatInstance(chatData, dotbot.chatManager, dotbot.chatPersistenceEnabled);
   initSessionsForCurrentChat(dotbot);
+  const messages = dotbot.currentChat.getDisplayMessages();
   dotbot.chatLogger.info(
-    { chatId: dotbot.currentChat.id, messageCount: dotbot.currentChat.getDisplayMessages().length, executionCount: dotbot.currentChat.getDisplayMessages().filter((m: { type: string }) => m.type === 'execution').length },
+    { chatId: dotbot.currentChat.id, messageCount: messages.length, executionCount: messages.filter((m: { type: string }) => m.type === 'execution').length },
     'Loaded chat instance (RPCs connect lazily when execution starts)'
   );
-  dotbot.emit({ type: DotBotEventType.CHAT_LOADED, chatId: dotbot.currentChat.id, messageCount: dotbot.currentChat.getDisplayMessages().length });
+  dotbot.emit({ type: DotBotEventType.CHAT_LOADED, chatId: dotbot.currentChat.id, messageCount: messages.length });
 }
@@ -4,3 +4,6 @@
 
 /** Maximum number of conversation history messages sent to the LLM. Older messages are dropped so the model prioritizes system prompt and Current Context over stale history. */
 export const CHAT_HISTORY_MESSAGE_LIMIT = 8;
+
+/** How long getBalance() results are reused for the same network + address. Roughly one block time; executions invalidate early. */
+export const BALANCE_CACHE_TTL_MS = 6_000;
@@ -11,6 +11,7 @@ import type { ExecutionSession } from '../rpcManager';
 import type { ExecutionPlan } from '../prompts/system/execution/types';
 import type { ExecutionMessage } from '../chat/types';
 import { prepareExecution, addExecutionMessageEarly } from './executionPreparation';
+import { invalidateBalanceCache } from './balanceChain';
 
 type DotBotInstance = any;
 
@@ -101,7 +102,11 @@ export async function startExecution(
   }
 
   const executioner = dotbot.executionSystem.getExecutioner();
-  await executioner.execute(executionArray, options);
+  try {
+    await executioner.execute(executionArray, options);
+  } finally {
+    invalidateBalanceCache(dotbot);
+  }
 
   const finalState = executionArray.getState();
   const executionMessage = findExecutionMessage(dotbot, executionId) as { id?: string } | undefined;
@@ -150,7 +155,11 @@ export async function startExecutionStateless(
   dotbot.dotbotLogger.info({ executionId, itemsCount: executionArray.getItems().length }, 'startExecutionStateless: Starting execution');
 
   const executioner = dotbot.executionSystem.getExecutioner();
-  await executioner.execute(executionArray, options);
+  try {
+    await executioner.execute(executionArray, options);
+  } finally {
+    invalidateBalanceCache(dotbot);
+  }
   cleanupExecutionSessions(dotbot, executionId);
 }
 
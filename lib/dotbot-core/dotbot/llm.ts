@@ -73,10 +73,6 @@ export async function getLLMResponse(dotbot: DotBotInstance, message: string, op
     },
     'LLM raw response'
   );
-  dotbot.dotbotLogger.debug(
-    { startsWithJsonBlock, hasJsonBlock, looksLikeCommandProse, shouldRetryFormat },
-    'Guardrail: format check'
-  );
 
   // RETRY GUARD: Format violation — response should start with ```json for ExecutionPlan
   // Trigger when: (1) prose before JSON, or (2) pure prose that looks like command response ("I've prepared...")
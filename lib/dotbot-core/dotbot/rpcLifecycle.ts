@@ -15,36 +15,9 @@ export async function ensureRpcConnectionsReady(dotbot: DotBotInstance): Promise
 
   dotbot.rpcLogger.debug({ network: dotbot.network }, 'ensureRpcConnectionsReady: Connecting (lazy loading)');
 
-  if (!dotbot.api) {
-    dotbot.api = await dotbot.relayChainManager.getReadApi();
-    const relayChainEndpoint = dotbot.relayChainManager.getCurrentEndpoint();
-    dotbot.rpcLogger.info({ endpoint: relayChainEndpoint, chain: 'relay' }, `Connected to Relay Chain via: ${relayChainEndpoint}`);
-    try {
-      const chainInfo = await dotbot.api.rpc.system.chain();
-      const detectedNetwork = detectNetworkFromChainName(chainInfo.toString());
-      if (detectedNetwork !== dotbot.network) {
-        dotbot.rpcLogger.warn({ detected: detectedNetwork, configured: dotbot.network }, 'Network mismatch detected');
-      }
-    } catch {
-      // skip
-    }
-  }
-
-  let assetHubApi: ApiPromise | null = null;
-  if (!dotbot.assetHubApi) {
-    try {
-      assetHubApi = await dotbot.assetHubManager.getReadApi();
-      dotbot.rpcLogger.info(
-        { endpoint: dotbot.assetHubManager.getCurrentEndpoint(), chain: 'asset-hub' },
-        'Connected to Asset Hub'
-      );
-      dotbot._setAssetHubApi(assetHubApi);
-    } catch (error) {
-      dotbot.rpcLogger.error({ error: error instanceof Error ? error.message : String(error) }, 'Asset Hub connection failed, will retry when needed');
-    }
-  } else {
-    assetHubApi = dotbot.assetHubApi;
-  }
+  // Relay and Asset Hub handshakes are independent: run them concurrently so the first
+  // request waits for the slower connection rather than both in sequence.
+  const [, assetHubApi] = await Promise.all([connectRelayChain(dotbot), connectAssetHub(dotbot)]);
 
   if (!dotbot.executionSystemInitialized) {
     const signer = new BrowserWalletSigner({ autoApprove: dotbot.config.autoApprove || false });
@@ -63,3 +36,39 @@ export async function ensureRpcConnectionsReady(dotbot: DotBotInstance): Promise
     dotbot.rpcLogger.debug({}, 'Execution system initialized (lazy loading)');
   }
 }
+
+/** Connect relay chain (if not yet connected) and warn when it is not the configured network. */
+async function connectRelayChain(dotbot: DotBotInstance): Promise<void> {
+  if (dotbot.api) return;
+
+  dotbot.api = await dotbot.relayChainManager.getReadApi();
+  const relayChainEndpoint = dotbot.relayChainManager.getCurrentEndpoint();
+  dotbot.rpcLogger.info({ endpoint: relayChainEndpoint, chain: 'relay' }, 'Connected to Relay Chain');
+  try {
+    const chainInfo = await dotbot.api.rpc.system.chain();
+    const detectedNetwork = detectNetworkFromChainName(chainInfo.toString());
+    if (detectedNetwork !== dotbot.network) {
+      dotbot.rpcLogger.warn({ detected: detectedNetwork, configured: dotbot.network }, 'Network mismatch detected');
+    }
+  } catch {
+    // skip
+  }
+}
+
+/** Connect Asset Hub (if not yet connected). Never throws: Asset Hub is optional and retried when needed. */
+async function connectAssetHub(dotbot: DotBotInstance): Promise<ApiPromise | null> {
+  if (dotbot.assetHubApi) return dotbot.assetHubApi;
+
+  try {
+    const assetHubApi: ApiPromise = await dotbot.assetHubManager.getReadApi();
+    dotbot.rpcLogger.info(
+      { endpoint: dotbot.assetHubManager.getCurrentEndpoint(), chain: 'asset-hub' },
+      'Connected to Asset Hub'
+    );
+    dotbot._setAssetHubApi(assetHubApi);
+    return assetHubApi;
+  } catch (error) {
+    dotbot.rpcLogger.error({ error: error instanceof Error ? error.message : String(error) }, 'Asset Hub connection failed, will retry when needed');
+    return null;
+  }
+}
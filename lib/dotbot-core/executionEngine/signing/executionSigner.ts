@@ -5,6 +5,7 @@
  */
 
 import { SubmittableExtrinsic } from '@polkadot/api/types';
+import { encodeAddress, decodeAddress } from '@polkadot/util-crypto';
 import { ExecutionItem, SigningRequest, BatchSigningRequest } from '../types';
 import { Signer } from '../signers/types';
 import { isBrowser } from '../../env';
@@ -142,7 +143,6 @@ export async function encodeAddressForChain(
   address: string,
   ss58Format: number
 ): Promise<string> {
-  const { encodeAddress, decodeAddress } = await import('@polkadot/util-crypto');
   const publicKey = decodeAddress(address);
   return encodeAddress(publicKey, ss58Format);
 }
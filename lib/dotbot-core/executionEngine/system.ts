@@ -339,11 +339,13 @@ export class ExecutionSystem {
     const sessionRelayApi = relayChainSession.api;
     const sessionAssetHubApi = assetHubSession?.api || null;
     
-    const items = executionArray.getState().items
+    // getState() rebuilds the whole state snapshot, so take it once
+    const allItems = executionArray.getState().items;
+    const items = allItems
       .filter((item: ExecutionItem) => item.executionType === 'extrinsic' && item.agentResult.extrinsic);
     
     this.executionLogger.debug({ 
-      totalItems: executionArray.getState().items.length,
+      totalItems: allItems.length,
       itemsToSimulate: items.length,
       itemIds: items.map(item => item.id)
     }, 'Running simulation for items');
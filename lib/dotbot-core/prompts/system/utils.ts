@@ -56,6 +56,12 @@ export function extractExecutionPlan(llmResponse: string): ExecutionPlan | null
 
   const normalized = llmResponse.trim();
 
+  // Fast path for conversational replies: every plan serializes a "steps" key, so without it
+  // none of the strategies below can succeed (and strategy 3 would just throw on prose twice)
+  if (!normalized.includes('"steps"')) {
+    return null;
+  }
+
   try {
     // Strategy 1: JSON in ```json code block (most common LLM format)
     const jsonMatch = normalized.match(/```json\s*([\s\S]*?)\s*```/i);
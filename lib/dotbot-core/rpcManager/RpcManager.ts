@@ -35,6 +35,7 @@ export class RpcManager {
   private healthTracker: HealthTracker;
   private currentEndpoint: string | null = null;
   private currentReadApi: ApiPromise | null = null;
+  private pendingReadApi: Promise<ApiPromise> | null = null;
   private connectionTimeout: number;
   private activeSessions: Set<ExecutionSession> = new Set();
   private rpcLogger = createSubsystemLogger(Subsystem.RPC);
@@ -279,13 +280,27 @@ export class RpcManager {
     if (this.currentReadApi && this.currentReadApi.isConnected) {
       return this.currentReadApi;
     }
-    
-    // Otherwise, connect to best available endpoint
+
+    // Concurrent callers on this manager (e.g. parallel getBalance reads, overlapping sessions) share one
+    // in-flight connect instead of each opening its own WebSocket and orphaning the losers
+    if (!this.pendingReadApi) {
+      this.pendingReadApi = this.connectReadApi().finally(() => {
+        this.pendingReadApi = null;
+      });
+    }
+    return this.pendingReadApi;
+  }
+
+  /**
+   * Connect the shared read API to the best available endpoint (see getReadApi)
+   */
+  private async connectReadApi(): Promise<ApiPromise> {
+    // Connect to best available endpoint
     const orderedEndpoints = this.healthTracker.getOrderedEndpoints();
     this.rpcLogger.info({ 
       totalEndpoints: this.endpoints.length,
       availableEndpoints: orderedEndpoints.length
-    }, `Attempting to connect to RPC endpoints (${orderedEndpoints.length} available out of ${this.endpoints.length} total)`);
+    }, 'Attempting to connect to RPC endpoints');
 
     if (orderedEndpoints.length === 0) {
       this.rpcLogger.warn({}, 'All endpoints marked as failed, resetting health for one final attempt');
@@ -333,7 +348,7 @@ export class RpcManager {
         endpoint,
         attempt: i + 1,
         total: orderedEndpoints.length
-      }, `Trying endpoint ${i + 1}/${orderedEndpoints.length}: ${endpoint}`);
+      }, 'Trying endpoint');
       
       let api: ApiPromise | null = null;
       for (let retry = 0; retry < 2 && !api; retry++) {
@@ -359,7 +374,7 @@ export class RpcManager {
         this.currentReadApi = connectedApi;
         connectedApi.on('disconnected', () => this.clearReadApiIf(connectedApi));
         connectedApi.on('error', () => this.clearReadApiIf(connectedApi));
-        this.rpcLogger.info({ endpoint }, `Successfully connected to endpoint: ${endpoint}`);
+        this.rpcLogger.info({ endpoint }, 'Successfully connected to endpoint');
         return connectedApi;
       }
       this.rpcLogger.warn({ 
@@ -367,7 +382,7 @@ export class RpcManager {
         error: lastError?.message ?? 'Unknown',
         attempt: i + 1,
         total: orderedEndpoints.length
-      }, `Failed to connect to endpoint ${i + 1}/${orderedEndpoints.length}, trying next endpoint`);
+      }, 'Failed to connect to endpoint, trying next endpoint');
       this.healthTracker.markEndpointFailed(endpoint);
     }
 
@@ -403,7 +418,7 @@ export class RpcManager {
     this.rpcLogger.info({ 
       totalEndpoints: this.endpoints.length,
       availableEndpoints: orderedEndpoints.length
-    }, `Creating execution session (${orderedEndpoints.length} available endpoints)`);
+    }, 'Creating execution session');
 
     if (orderedEndpoints.length === 0) {
       this.rpcLogger.warn({}, 'All endpoints marked as failed, resetting health for execution session');
@@ -425,7 +440,7 @@ export class RpcManager {
         endpoint,
         attempt: i + 1,
         total: orderedEndpoints.length
-      }, `Trying endpoint ${i + 1}/${orderedEndpoints.length} for execution session: ${endpoint}`);
+      }, 'Trying endpoint for execution session');
       
       let api: ApiPromise | null = null;
       for (let retry = 0; retry < 2 && !api; retry++) {
@@ -447,7 +462,7 @@ export class RpcManager {
       if (api) {
         const session = new ExecutionSession(api, endpoint);
         this.activeSessions.add(session);
-        this.rpcLogger.info({ endpoint }, `Execution session created with endpoint: ${endpoint}`);
+        this.rpcLogger.info({ endpoint }, 'Execution session created');
         api.on('disconnected', () => {
           session.markInactive();
           this.activeSessions.delete(session);
@@ -460,8 +475,9 @@ export class RpcManager {
         endpoint,
         error: message,
         attempt: i + 1,
-        total: orderedEndpoints.length
-      }, `Failed to connect to endpoint ${i + 1}/${orderedEndpoints.length}${i < orderedEndpoints.length - 1 ? ', trying next' : ''}`);
+        total: orderedEndpoints.length,
+        willTryNext: i < orderedEndpoints.length - 1
+      }, 'Failed to connect to endpoint for execution session');
       this.healthTracker.markEndpointFailed(endpoint);
     }
 
@@ -470,7 +486,7 @@ export class RpcManager {
     this.rpcLogger.error({ 
       totalEndpoints: orderedEndpoints.length,
       lastError: lastErrorMessage
-    }, `Failed to create execution session - all ${orderedEndpoints.length} endpoints failed`);
+    }, 'Failed to create execution session - all endpoints failed');
     
     throw new Error(
       `Failed to create execution session. Tried all ${orderedEndpoints.length} available endpoints, but all failed. ` +
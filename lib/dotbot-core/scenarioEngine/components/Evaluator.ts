@@ -333,6 +333,9 @@ export class Evaluator {
     let totalScore = 0;
     let totalWeight = 0;
 
+    // Lowercase the response once for all text checks below instead of once per check
+    const lowerResponse = lastResponse.toLowerCase();
+
     /**
      * Weighted Scoring System:
      * 
@@ -416,7 +419,7 @@ export class Evaluator {
     // Check shouldContain (weight: 1 - medium importance)
     if (expectation.shouldContain?.length) {
       for (const text of expectation.shouldContain) {
-        const met = lastResponse.toLowerCase().includes(text.toLowerCase());
+        const met = lowerResponse.includes(text.toLowerCase());
         const weight = 1;
         checks.push({
           name: `shouldContain: "${text}"`,
@@ -434,7 +437,7 @@ export class Evaluator {
     // Check shouldNotContain (weight: 1 - medium importance)
     if (expectation.shouldNotContain?.length) {
       for (const text of expectation.shouldNotContain) {
-        const met = !lastResponse.toLowerCase().includes(text.toLowerCase());
+        const met = !lowerResponse.includes(text.toLowerCase());
         const weight = 1;
         checks.push({
           name: `shouldNotContain: "${text}"`,
@@ -452,7 +455,7 @@ export class Evaluator {
     // Check shouldMention (weight: 1 - medium importance)
     if (expectation.shouldMention?.length) {
       for (const topic of expectation.shouldMention) {
-        const met = this.checkMentions(lastResponse, topic);
+        const met = this.checkMentions(lowerResponse, topic);
         const weight = 1;
         checks.push({
           name: `shouldMention: "${topic}"`,
@@ -470,7 +473,7 @@ export class Evaluator {
     // Check shouldAskFor (clarification) (weight: 2 - high importance)
     if (expectation.shouldAskFor?.length) {
       for (const item of expectation.shouldAskFor) {
-        const met = this.checkAsksFor(lastResponse, item);
+        const met = this.checkAsksFor(lowerResponse, item);
         const weight = 2;
         checks.push({
           name: `shouldAskFor: "${item}"`,
@@ -488,7 +491,7 @@ export class Evaluator {
     // Check shouldWarn (weight: 2 - high importance)
     if (expectation.shouldWarn?.length) {
       for (const warning of expectation.shouldWarn) {
-        const met = this.checkWarns(lastResponse, warning);
+        const met = this.checkWarns(lowerResponse, warning);
         const weight = 2;
         checks.push({
           name: `shouldWarn: "${warning}"`,
@@ -505,7 +508,7 @@ export class Evaluator {
 
     // Check shouldReject (weight: 2 - high importance)
     if (expectation.shouldReject !== undefined) {
-      const isRejection = this.detectRejection(lastResponse);
+      const isRejection = this.detectRejection(lowerResponse);
       const met = isRejection === expectation.shouldReject;
       const weight = 2;
       checks.push({
@@ -898,22 +901,24 @@ export class Evaluator {
       // Not JSON
     }
 
+    const lowerResponse = response.toLowerCase();
+
     // Check for execution keywords
     if (
       response.includes('ExecutionArray') ||
       response.includes('Transaction') ||
       response.includes('extrinsic') ||
-      response.toLowerCase().includes('execution plan')
+      lowerResponse.includes('execution plan')
     ) {
       return 'execution';
     }
 
     // Check for error
     if (
-      response.toLowerCase().includes('error') ||
-      response.toLowerCase().includes('failed') ||
-      response.toLowerCase().includes("can't") ||
-      response.toLowerCase().includes('cannot')
+      lowerResponse.includes('error') ||
+      lowerResponse.includes('failed') ||
+      lowerResponse.includes("can't") ||
+      lowerResponse.includes('cannot')
     ) {
       return 'error';
     }
@@ -921,8 +926,8 @@ export class Evaluator {
     // Check for clarification
     if (
       response.includes('?') ||
-      response.toLowerCase().includes('please specify') ||
-      response.toLowerCase().includes('could you')
+      lowerResponse.includes('please specify') ||
+      lowerResponse.includes('could you')
     ) {
       return 'clarification';
     }
@@ -930,8 +935,7 @@ export class Evaluator {
     return 'text';
   }
 
-  private checkMentions(response: string, topic: string): boolean {
-    const lowerResponse = response.toLowerCase();
+  private checkMentions(lowerResponse: string, topic: string): boolean {
     const lowerTopic = topic.toLowerCase();
     
     // Direct mention
@@ -953,8 +957,7 @@ export class Evaluator {
     return topicSynonyms.some(syn => lowerResponse.includes(syn));
   }
 
-  private checkAsksFor(response: string, item: string): boolean {
-    const lowerResponse = response.toLowerCase();
+  private checkAsksFor(lowerResponse: string, item: string): boolean {
     const lowerItem = item.toLowerCase();
 
     // Look for question patterns
@@ -972,8 +975,7 @@ export class Evaluator {
     return questionPatterns.some(pattern => lowerResponse.includes(pattern));
   }
 
-  private checkWarns(response: string, warning: string): boolean {
-    const lowerResponse = response.toLowerCase();
+  private checkWarns(lowerResponse: string, warning: string): boolean {
     const lowerWarning = warning.toLowerCase();
 
     // Direct mention
@@ -987,9 +989,7 @@ export class Evaluator {
            lowerResponse.includes(lowerWarning.split(' ')[0]);
   }
 
-  private detectRejection(response: string): boolean {
-    const lowerResponse = response.toLowerCase();
-
+  private detectRejection(lowerResponse: string): boolean {
     const rejectionIndicators = [
       "can't do that",
       'cannot do that',
@@ -372,6 +372,9 @@ export class StateAllocator {
       errors: [],
     };
 
+    // Entity balances fetched by the live pre-flight, reused when allocating below
+    const currentBalances = new Map<string, BN>();
+
     // For live mode, check user's wallet balance
     // First, calculate how much we actually need by checking each account's current balance
     if (this.config.mode === 'live') {
@@ -385,14 +388,27 @@ export class StateAllocator {
         
         await this.api!.isReady;
         
-        // Calculate total needed by checking each account's current balance
-        let totalNeeded = new BN(0);
+        // Fetch the wallet and every entity account in one batched storage query
+        // instead of one round-trip per account
+        const resolvedAccounts: typeof config.accounts = [];
+        const entityAddresses: string[] = [];
         for (const accountConfig of config.accounts) {
           const entity = this.config.entityResolver(accountConfig.entityName);
           if (!entity) continue;
-          
+          resolvedAccounts.push(accountConfig);
+          entityAddresses.push(entity.address);
+        }
+        const [walletAccountData, ...entityAccountData] = await this.queryAccountData([
+          this.config.walletAccount.address,
+          ...entityAddresses,
+        ]);
+        
+        // Calculate total needed by checking each account's current balance
+        let totalNeeded = new BN(0);
+        for (const [index, accountConfig] of resolvedAccounts.entries()) {
           const requiredBalance = this.parseBalance(accountConfig.balance);
-          const currentBalance = await this.getCurrentBalance(entity.address);
+          const currentBalance = new BN(entityAccountData[index].free.toString());
+          currentBalances.set(entityAddresses[index], currentBalance);
           const requiredBN = new BN(requiredBalance.planck);
           
           if (currentBalance.lt(requiredBN)) {
@@ -405,10 +421,8 @@ export class StateAllocator {
         }
         
         // Check wallet balance
-        const accountInfo = await this.api!.query.system.account(this.config.walletAccount.address);
-        const accountData = (accountInfo as any).data;
-        const freeBalance = new BN(accountData.free.toString());
-        const reservedBalance = new BN(accountData.reserved.toString());
+        const freeBalance = new BN(walletAccountData.free.toString());
+        const reservedBalance = new BN(walletAccountData.reserved.toString());
         const availableBalance = freeBalance.sub(reservedBalance);
         
         const token = this.config.chain.includes('polkadot') ? 'DOT' : 'WND';
@@ -462,7 +476,8 @@ export class StateAllocator {
         await this.allocateBalance(
           entity.address,
           accountConfig.balance,
-          result
+          result,
+          currentBalances
         );
 
         // Allocate assets if specified
@@ -614,7 +629,8 @@ export class StateAllocator {
   private async allocateBalance(
     address: string,
     balance: string,
-    result: AllocationResult
+    result: AllocationResult,
+    currentBalances?: Map<string, BN>
   ): Promise<void> {
     const parsedBalance = this.parseBalance(balance);
     const requiredBN = new BN(parsedBalance.planck);
@@ -641,7 +657,8 @@ export class StateAllocator {
         // LIVE MODE: Create REAL balances on REAL chain
         // DotBot will query the real chain and see these balances
         // ✅ No duplicate state - everything is on the real chain
-        const currentBalance = await this.getCurrentBalance(address);
+        // Reuse the batched pre-flight balance when we have one, query otherwise
+        const currentBalance = currentBalances?.get(address) ?? await this.getCurrentBalance(address);
         if (currentBalance.lt(requiredBN)) {
           // Only transfer the difference
           const needed = requiredBN.sub(currentBalance);
@@ -692,6 +709,18 @@ export class StateAllocator {
     }
   }
 
+  /**
+   * Query account data for several addresses in a single batched storage call (live mode)
+   */
+  private async queryAccountData(addresses: string[]): Promise<any[]> {
+    if (!this.api) {
+      throw new Error('API not initialized for live mode');
+    }
+    await this.api.isReady;
+    const accountInfos = await this.api.query.system.account.multi(addresses);
+    return accountInfos.map(accountInfo => (accountInfo as any).data);
+  }
+
   /**
    * Set balance on Chopsticks fork (emulated mode)
    * 
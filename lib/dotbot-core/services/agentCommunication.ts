@@ -5,6 +5,95 @@ import { AIService, AIServiceConfig, AIProviderType } from './ai/aiService';
 import { createSubsystemLogger, Subsystem } from './logger';
 import { getEnv } from '../env';
 
+// Routing rules, checked in priority order (first match wins)
+const ROUTING_RULES: ReadonlyArray<readonly [RegExp, string]> = [
+  [/send|transfer/i, 'asset-transfer'],
+  [/swap|exchange/i, 'asset-swap'],
+  [/vote|governance|referendum/i, 'governance'],
+  [/multisig|multi-sig/i, 'multisig'],
+];
+
+const ACTION_KEYWORDS = /transfer|send|swap|vote|create|sign|approve/i;
+
+// Suggestion lists per agent, keyed by the message keyword that triggers them (first match wins)
+type SuggestionRules = ReadonlyArray<readonly [keyword: string, suggestions: readonly string[]]>;
+const SUGGESTION_RULES: ReadonlyMap<string, SuggestionRules> = new Map<string, SuggestionRules>([
+  ['asset-transfer', [
+    ['balance', ['Check my DOT balance', 'Show all token balances', 'Check balance on different networks']],
+    ['transfer', ['Transfer 1 DOT to Alice', 'Send 5 DOT to AssetHub', 'Batch transfer to multiple addresses']],
+  ]],
+  ['asset-swap', [
+    ['swap', ['Swap DOT for USDC', 'Find best price for DOT/USDT', 'Show available DEXs']],
+  ]],
+  ['governance', [
+    ['vote', ['Show active referendums', 'Vote on referendum #123', 'Check my voting power']],
+  ]],
+  ['multisig', [
+    ['multisig', ['Create 2-of-3 multisig', 'Show pending multisig transactions', 'Add signer to multisig']],
+  ]],
+]);
+
+// Built-in agent definitions. Each service instance gets its own copy (including the
+// capabilities list) so per-instance updates never leak into other instances.
+const AGENT_DEFINITIONS: ReadonlyArray<Readonly<AgentInfo>> = [
+  // Asset Transfer Agent
+  {
+    id: 'asset-transfer',
+    name: 'Asset Transfer Agent',
+    description: 'Handles DOT and token transfers across Polkadot ecosystem',
+    status: 'online',
+    capabilities: [
+      'Native token transfers',
+      'Cross-chain transfers',
+      'Batch transfers',
+      'Fee estimation'
+    ],
+    version: '1.0.0'
+  },
+  // Asset Swap Agent
+  {
+    id: 'asset-swap',
+    name: 'Asset Swap Agent',
+    description: 'Facilitates token swaps across DEXs in Polkadot',
+    status: 'online',
+    capabilities: [
+      'DEX routing',
+      'Optimal price finding',
+      'Slippage protection',
+      'Multi-hop swaps'
+    ],
+    version: '1.0.0'
+  },
+  // Governance Agent
+  {
+    id: 'governance',
+    name: 'Governance Agent',
+    description: 'Manages governance voting and proposals',
+    status: 'online',
+    capabilities: [
+      'Referendum voting',
+      'Proposal tracking',
+      'Vote delegation',
+      'Council elections'
+    ],
+    version: '1.0.0'
+  },
+  // Multisig Agent
+  {
+    id: 'multisig',
+    name: 'Multisig Agent',
+    description: 'Coordinates multisig wallet operations',
+    status: 'online',
+    capabilities: [
+      'Multisig creation',
+      'Transaction proposals',
+      'Signature collection',
+      'Execution coordination'
+    ],
+    version: '1.0.0'
+  },
+];
+
 export class AgentCommunicationService {
   private agents: Map<string, AgentInfo> = new Map();
   private aiService: AIService;
@@ -19,65 +108,12 @@ export class AgentCommunicationService {
   }
 
   private initializeAgents() {
-    // Asset Transfer Agent
-    this.agents.set('asset-transfer', {
-      id: 'asset-transfer',
-      name: 'Asset Transfer Agent',
-      description: 'Handles DOT and token transfers across Polkadot ecosystem',
-      status: 'online',
-      capabilities: [
-        'Native token transfers',
-        'Cross-chain transfers',
-        'Batch transfers',
-        'Fee estimation'
-      ],
-      version: '1.0.0'
-    });
-
-    // Asset Swap Agent
-    this.agents.set('asset-swap', {
-      id: 'asset-swap',
-      name: 'Asset Swap Agent',
-      description: 'Facilitates token swaps across DEXs in Polkadot',
-      status: 'online',
-      capabilities: [
-        'DEX routing',
-        'Optimal price finding',
-        'Slippage protection',
-        'Multi-hop swaps'
-      ],
-      version: '1.0.0'
-    });
-
-    // Governance Agent
-    this.agents.set('governance', {
-      id: 'governance',
-      name: 'Governance Agent',
-      description: 'Manages governance voting and proposals',
-      status: 'online',
-      capabilities: [
-        'Referendum voting',
-        'Proposal tracking',
-        'Vote delegation',
-        'Council elections'
-      ],
-      version: '1.0.0'
-    });
-
-    // Multisig Agent
-    this.agents.set('multisig', {
-      id: 'multisig',
-      name: 'Multisig Agent',
-      description: 'Coordinates multisig wallet operations',
-      status: 'online',
-      capabilities: [
-        'Multisig creation',
-        'Transaction proposals',
-        'Signature collection',
-        'Execution coordination'
-      ],
-      version: '1.0.0'
-    });
+    for (const definition of AGENT_DEFINITIONS) {
+      this.agents.set(definition.id, {
+        ...definition,
+        capabilities: definition.capabilities ? [...definition.capabilities] : undefined,
+      });
+    }
   }
 
   // Get available agents
@@ -92,20 +128,11 @@ export class AgentCommunicationService {
 
   // Route message to appropriate agent
   routeMessage(message: string): string {
-    const lowercaseMessage = message.toLowerCase();
-    
     // Simple routing logic - in production this would be more sophisticated
-    if (lowercaseMessage.includes('send') || lowercaseMessage.includes('transfer')) {
-      return 'asset-transfer';
-    }
-    if (lowercaseMessage.includes('swap') || lowercaseMessage.includes('exchange')) {
-      return 'asset-swap';
-    }
-    if (lowercaseMessage.includes('vote') || lowercaseMessage.includes('governance') || lowercaseMessage.includes('referendum')) {
-      return 'governance';
-    }
-    if (lowercaseMessage.includes('multisig') || lowercaseMessage.includes('multi-sig')) {
-      return 'multisig';
+    for (const [pattern, agent] of ROUTING_RULES) {
+      if (pattern.test(message)) {
+        return agent;
+      }
     }
     
     // Default to transfer agent for simple operations
@@ -236,45 +263,24 @@ export class AgentCommunicationService {
 
   // Check if user message requires action
   private requiresUserAction(message: string): boolean {
-    const actionKeywords = ['transfer', 'send', 'swap', 'vote', 'create', 'sign', 'approve'];
-    const lowerMessage = message.toLowerCase();
-    return actionKeywords.some(keyword => lowerMessage.includes(keyword));
+    return ACTION_KEYWORDS.test(message);
   }
 
-  // Generate contextual suggestions based on agent and message
+  // Generate contextual suggestions based on agent and message (at most 3)
   private generateSuggestions(agent: string, message: string): string[] {
-    const suggestions: string[] = [];
-    const lowerMessage = message.toLowerCase();
-
-    switch (agent) {
-      case 'asset-transfer':
-        if (lowerMessage.includes('balance')) {
-          suggestions.push('Check my DOT balance', 'Show all token balances', 'Check balance on different networks');
-        } else if (lowerMessage.includes('transfer')) {
-          suggestions.push('Transfer 1 DOT to Alice', 'Send 5 DOT to AssetHub', 'Batch transfer to multiple addresses');
-        }
-        break;
-      
-      case 'asset-swap':
-        if (lowerMessage.includes('swap')) {
-          suggestions.push('Swap DOT for USDC', 'Find best price for DOT/USDT', 'Show available DEXs');
-        }
-        break;
-      
-      case 'governance':
-        if (lowerMessage.includes('vote')) {
-          suggestions.push('Show active referendums', 'Vote on referendum #123', 'Check my voting power');
-        }
-        break;
-      
-      case 'multisig':
-        if (lowerMessage.includes('multisig')) {
-          suggestions.push('Create 2-of-3 multisig', 'Show pending multisig transactions', 'Add signer to multisig');
-        }
-        break;
+    const rules = SUGGESTION_RULES.get(agent);
+    if (!rules) {
+      return [];
     }
 
-    return suggestions.slice(0, 3); // Limit to 3 suggestions
+    const lowerMessage = message.toLowerCase();
+    for (const [keyword, suggestions] of rules) {
+      if (lowerMessage.includes(keyword)) {
+        // Fresh copy: callers own response.metadata.suggestions and may modify it
+        return [...suggestions];
+      }
+    }
+    return [];
   }
 
   // Update agent status
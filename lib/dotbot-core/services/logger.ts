@@ -37,6 +37,9 @@ const shouldUsePretty = isNode() && !isBrowser() && process.env.LOG_FORMAT !== '
 // Default to false (completely excluded) - set LOG_SHOW_METADATA=true to include them
 const showMetadata = process.env.LOG_SHOW_METADATA === 'true' || process.env.LOG_SHOW_METADATA === '1';
 
+// Fields stripped from every log line when metadata is hidden
+const METADATA_FIELDS = ['service', 'version', 'environment', 'userAgent', 'subsystem', 'endpoint', 'chain'] as const;
+
 // Build ignore list for pino-pretty (only pid and hostname, since metadata is excluded from base)
 const ignoreFields = 'pid,hostname';
 
@@ -69,14 +72,14 @@ const loggerConfig: pino.LoggerOptions = {
         object.service = isBackend ? 'DotBot-Backend' : 'DotBot-Services';
         object.version = isBackend ? (process.env.DOTBOT_EXPRESS_VERSION || LIB_VERSION) : LIB_VERSION;
       } else {
-        // Remove metadata fields when LOG_SHOW_METADATA is disabled
-        delete object.service;
-        delete object.version;
-        delete object.environment;
-        delete object.userAgent;
-        delete object.subsystem;
-        delete object.endpoint;
-        delete object.chain;
+        // Remove metadata fields when LOG_SHOW_METADATA is disabled.
+        // Most lines carry none of them, so check first: `delete` always takes the slow
+        // runtime path and can drop the object to dictionary mode before serialization.
+        for (const field of METADATA_FIELDS) {
+          if (field in object) {
+            delete object[field];
+          }
+        }
       }
       return object;
     },
@@ -108,9 +111,19 @@ const loggerConfig: pino.LoggerOptions = {
 // Create the base logger instance
 const baseLogger = pino(loggerConfig);
 
+// One child logger per subsystem, shared by every caller.
+// pino serializes child bindings when the child is created, and many classes create their
+// logger per instance (or per call), so reuse it instead of re-binding each time.
+const subsystemLoggers = new Map<Subsystem, pino.Logger>();
+
 // Create subsystem loggers
 export const createSubsystemLogger = (subsystem: Subsystem) => {
-  return baseLogger.child({ subsystem });
+  let subsystemLogger = subsystemLoggers.get(subsystem);
+  if (!subsystemLogger) {
+    subsystemLogger = baseLogger.child({ subsystem });
+    subsystemLoggers.set(subsystem, subsystemLogger);
+  }
+  return subsystemLogger;
 };
 
 // Helper function for critical errors with types
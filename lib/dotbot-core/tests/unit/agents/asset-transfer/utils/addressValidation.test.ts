@@ -13,6 +13,7 @@ import {
   validateTransferAddresses,
   validateSenderAddress,
   validateSenderAddressForSigning,
+  clearAddressValidationCache,
 } from '../../../../../agents/asset-transfer/utils/addressValidation';
 import { AgentError } from '../../../../../agents/types';
 import * as utilCrypto from '@polkadot/util-crypto';
@@ -23,6 +24,7 @@ const decodeAddress = jest.mocked(utilCrypto.decodeAddress);
 describe('Address Validation Utilities', () => {
   beforeEach(() => {
     jest.clearAllMocks();
+    clearAddressValidationCache();
   });
 
   describe('validateAddress()', () => {
@@ -39,6 +41,28 @@ describe('Address Validation Utilities', () => {
       expect(decodeAddress).toHaveBeenCalledWith(address);
     });
 
+    it('should reuse a previous successful validation for the same address', () => {
+      const address = '15oF4uVJwmo4TdGW7VfQxNLavjCXviqxT9S1MgbjMNHr6Sp5';
+      isAddress.mockReturnValue(true);
+      decodeAddress.mockReturnValue(new Uint8Array([1, 2, 3]));
+
+      expect(validateAddress(address).valid).toBe(true);
+      expect(validateAddress(address).valid).toBe(true);
+
+      expect(isAddress).toHaveBeenCalledTimes(1);
+      expect(decodeAddress).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not cache failed validations', () => {
+      const address = 'invalid-address';
+      isAddress.mockReturnValue(false);
+
+      validateAddress(address);
+      validateAddress(address);
+
+      expect(isAddress).toHaveBeenCalledTimes(2);
+    });
+
     it('should reject empty address', () => {
       const result = validateAddress('');
 
@@ -7,6 +7,7 @@ import {
   parseAndValidateAmountWithCapabilities,
   parseAmount,
   formatAmount,
+  planckMultiplier,
 } from '../../../../../agents/asset-transfer/utils/amountParser';
 import { TransferCapabilities } from '../../../../../agents/asset-transfer/utils/transferCapabilities';
 import { AgentError } from '../../../../../agents/types';
@@ -50,6 +51,16 @@ describe('Amount Parser Utilities', () => {
     });
   });
 
+  describe('planckMultiplier()', () => {
+    it('should return 10^decimals', () => {
+      expect(planckMultiplier(10).toString()).toBe('10000000000');
+      expect(planckMultiplier(0).toString()).toBe('1');
+    });
+    it('should reuse the computed value for the same decimals', () => {
+      expect(planckMultiplier(12)).toBe(planckMultiplier(12));
+    });
+  });
+
   describe('parseAmount()', () => {
     it('should parse decimal string to Planck', () => {
       const result = parseAmount('1.5', 10);
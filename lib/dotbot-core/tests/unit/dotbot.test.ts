@@ -1075,6 +1075,24 @@ describe('DotBot', () => {
       expect(balance.total).toBe('5000000000000'); // 200 + 300 DOT
     });
 
+    it('should reuse a recent balance instead of querying again', async () => {
+      const relayAccount = jest.fn().mockResolvedValue({
+        toJSON: () => ({ data: { free: '1000000000000', reserved: '0', frozen: '0' } }),
+      });
+      const assetHubAccount = jest.fn().mockResolvedValue({
+        toJSON: () => ({ data: { free: '500000000000', reserved: '0', frozen: '0' } }),
+      });
+      (mockRelayChainApi.query as any) = { system: { account: relayAccount } };
+      (mockAssetHubApi.query as any) = { system: { account: assetHubAccount } };
+
+      const first = await dotbot.getBalance();
+      const second = await dotbot.getBalance();
+
+      expect(second).toEqual(first);
+      expect(relayAccount).toHaveBeenCalledTimes(1);
+      expect(assetHubAccount).toHaveBeenCalledTimes(1);
+    });
+
     it('should handle missing Asset Hub connection gracefully', async () => {
       const mockRelayData = {
         data: {
@@ -1102,6 +1120,19 @@ describe('DotBot', () => {
       expect(balance.total).toBe('1000000000000'); // Only Relay Chain balance
     });
 
+    it('should not cache a relay-only balance while Asset Hub is not connected', async () => {
+      const relayAccount = jest.fn().mockResolvedValue({
+        toJSON: () => ({ data: { free: '1000000000000', reserved: '0', frozen: '0' } }),
+      });
+      (mockRelayChainApi.query as any) = { system: { account: relayAccount } };
+      (dotbot as any).assetHubApi = null;
+
+      await dotbot.getBalance();
+      await dotbot.getBalance();
+
+      expect(relayAccount).toHaveBeenCalledTimes(2);
+    });
+
     it('should handle missing balance data with defaults', async () => {
       const mockRelayData = {
         data: {},
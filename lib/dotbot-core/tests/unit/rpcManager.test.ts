@@ -266,6 +266,18 @@ describe('RpcManager', () => {
       expect(WsProvider).toHaveBeenCalledTimes(1);
     });
 
+    it('should share one connection attempt between concurrent callers', async () => {
+      const manager = new RpcManager({
+        endpoints: ['wss://rpc.polkadot.io'],
+        enablePeriodicHealthChecks: false,
+      });
+
+      const [api1, api2] = await Promise.all([manager.getReadApi(), manager.getReadApi()]);
+
+      expect(api1).toBe(api2);
+      expect(WsProvider).toHaveBeenCalledTimes(1);
+    });
+
     it('should failover to next endpoint if first fails', async () => {
       const manager = new RpcManager({
         endpoints: ['wss://rpc.polkadot.io', 'wss://polkadot-rpc.dwellir.com'],
@@ -264,6 +264,63 @@ describe('StateAllocator', () => {
         })
       ).rejects.toThrow('Synthetic mode is not implemented yet');
     });
+
+    it('should fetch all live balances in one batched query', async () => {
+      const walletAddress = '5DAAnrj7VHTznn2AWBemMuyBwZWs6FNFjdyVXUeYum3PTXFy';
+      const aliceAddress = mockEntities.get('Alice')!.address;
+      const bobAddress = mockEntities.get('Bob')!.address;
+
+      // Results come back in request order: wallet first, then resolved entities
+      const account: any = jest.fn();
+      account.multi = jest.fn().mockResolvedValue([
+        { data: { free: '1000000000000000', reserved: '0' } }, // wallet: 1000 WND
+        { data: { free: '100000000000000', reserved: '0' } },  // Alice: 100 WND
+        { data: { free: '10000000000000', reserved: '0' } },   // Bob: 10 WND
+      ]);
+      const mockApi = {
+        isReady: Promise.resolve(),
+        query: { system: { account } },
+        disconnect: jest.fn().mockResolvedValue(undefined),
+      };
+      const mockRpcManager = {
+        createExecutionSession: jest.fn().mockResolvedValue({ api: mockApi, isActive: true }),
+      };
+
+      const allocator = new StateAllocator({
+        mode: 'live',
+        chain: 'westend',
+        entityResolver: mockEntityResolver,
+        rpcManagerProvider: () => ({
+          relayChainManager: mockRpcManager as any,
+        }),
+        walletAccount: { address: walletAddress, source: 'test' },
+        signer: {},
+      });
+      const batchTransfers = jest.spyOn(allocator as any, 'batchTransfers').mockResolvedValue(undefined);
+
+      await allocator.initialize();
+
+      const result = await allocator.allocateWalletState({
+        accounts: [
+          { entityName: 'Alice', balance: '100 WND' },
+          { entityName: 'NonExistent', balance: '5 WND' },
+          { entityName: 'Bob', balance: '50 WND' },
+        ],
+      });
+
+      // Unresolved entities are left out of the query, so indices stay aligned
+      expect(account.multi).toHaveBeenCalledTimes(1);
+      expect(account.multi).toHaveBeenCalledWith([walletAddress, aliceAddress, bobAddress]);
+      expect(account).not.toHaveBeenCalled();
+
+      // Only Bob is short, by 40 WND
+      expect(batchTransfers).toHaveBeenCalledWith(
+        [{ address: bobAddress, planck: '40000000000000' }],
+        result
+      );
+      expect(result.success).toBe(false);
+      expect(result.errors[0]).toContain('NonExistent');
+    });
   });
 
   describe('Local Storage Allocation', () => {
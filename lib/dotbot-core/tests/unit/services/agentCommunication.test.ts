@@ -119,6 +119,35 @@ describe('AgentCommunicationService', () => {
     it('should default to asset-transfer for unknown messages', () => {
       expect(service.routeMessage('hello')).toBe('asset-transfer');
     });
+
+    it('should match keywords case-insensitively', () => {
+      expect(service.routeMessage('Send 5 DOT to Alice')).toBe('asset-transfer');
+      expect(service.routeMessage('SWAP DOT for USDC')).toBe('asset-swap');
+    });
+
+    it('should respect routing priority when several keywords match', () => {
+      expect(service.routeMessage('swap DOT for USDC, then send it to Bob')).toBe('asset-transfer');
+      expect(service.routeMessage('vote with my multisig')).toBe('governance');
+    });
+  });
+
+  describe('generateSuggestions()', () => {
+    it('should return keyword-specific suggestions for the agent', () => {
+      const suggestions = service['generateSuggestions']('asset-transfer', 'What is my balance?');
+      expect(suggestions).toEqual(['Check my DOT balance', 'Show all token balances', 'Check balance on different networks']);
+    });
+
+    it('should return a mutable copy that does not affect later suggestions', () => {
+      const first = service['generateSuggestions']('governance', 'vote yes');
+      first.push('Extra suggestion');
+
+      expect(service['generateSuggestions']('governance', 'vote yes')).toHaveLength(3);
+    });
+
+    it('should return no suggestions for unknown agents or unmatched messages', () => {
+      expect(service['generateSuggestions']('unknown', 'transfer')).toEqual([]);
+      expect(service['generateSuggestions']('governance', 'hello')).toEqual([]);
+    });
   });
 
   describe('sendToAgent()', () => {
@@ -155,5 +184,19 @@ describe('AgentCommunicationService', () => {
       const agent = service.getAgent('asset-transfer');
       expect(agent?.status).toBe('offline');
     });
+
+    it('should not affect agent status in other service instances', () => {
+      service.updateAgentStatus('asset-transfer', 'offline');
+
+      const otherService = new AgentCommunicationService();
+      expect(otherService.getAgent('asset-transfer')?.status).toBe('online');
+    });
+
+    it('should not share capabilities lists between service instances', () => {
+      service.getAgent('asset-transfer')?.capabilities?.push('Extra capability');
+
+      const otherService = new AgentCommunicationService();
+      expect(otherService.getAgent('asset-transfer')?.capabilities).not.toContain('Extra capability');
+    });
   });
 });
@@ -38,6 +38,16 @@ interface DotBotChatRequest {
   provider?: AIProviderType;
 }
 
+// Fixed validation error bodies, built once and shared (responses are serialized, never mutated)
+const INVALID_MESSAGE_RESPONSE = Object.freeze({
+  error: 'Invalid request',
+  message: 'Message field is required and must be a string'
+});
+const MISSING_WALLET_RESPONSE = Object.freeze({
+  error: 'Invalid request',
+  message: 'Wallet address is required'
+});
+
 // Implementation is in dotbot-express (DotBotSessionManager)
 // Routes use the session manager - clean separation of concerns
 
@@ -65,10 +75,7 @@ router.post('/chat', async (req: Request, res: Response) => {
       messageType: typeof message,
       messageLength: message?.length 
     }, 'Invalid chat request: message missing or not a string');
-    return res.status(400).json({
-      error: 'Invalid request',
-      message: 'Message field is required and must be a string'
-    });
+    return res.status(400).json(INVALID_MESSAGE_RESPONSE);
   }
 
   // Validate wallet
@@ -77,10 +84,7 @@ router.post('/chat', async (req: Request, res: Response) => {
       hasWallet: !!wallet,
       walletAddress: wallet?.address 
     }, 'Invalid chat request: wallet missing or invalid');
-    return res.status(400).json({
-      error: 'Invalid request',
-      message: 'Wallet address is required'
-    });
+    return res.status(400).json(MISSING_WALLET_RESPONSE);
   }
 
   try {
@@ -259,10 +263,7 @@ router.post('/session', async (req: Request, res: Response) => {
     wallet = walletParam;
 
     if (!wallet || !wallet.address) {
-      return res.status(400).json({
-        error: 'Invalid request',
-        message: 'Wallet address is required'
-      });
+      return res.status(400).json(MISSING_WALLET_RESPONSE);
     }
 
     const effectiveSessionId = sessionId || `wallet:${wallet.address}:${environment}`;
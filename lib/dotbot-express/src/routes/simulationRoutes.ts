@@ -7,6 +7,7 @@ import type { ApiPromise } from '@polkadot/api';
 import type { HexString } from '@polkadot/util/types';
 import { BN } from '@polkadot/util';
 import { hexToU8a } from '@polkadot/util';
+import { encodeAddress, decodeAddress } from '@polkadot/util-crypto';
 import { ApiPromise as ApiPromiseClass, WsProvider } from '@polkadot/api';
 import { createChopsticksDatabase, type Database } from '@dotbot/core/services/simulation/database';
 import { classifyChopsticksError } from '@dotbot/core/services/simulation/chopsticksIgnorePolicy';
@@ -156,7 +157,6 @@ async function simulateTransactionInternal(
     let fee = '0';
     if (extrinsicForFee) {
       try {
-        const { encodeAddress, decodeAddress } = await import('@polkadot/util-crypto');
         const publicKey = decodeAddress(request.senderAddress);
         const ss58Format = api.registry.chainSS58 || 0;
         const encodedSenderAddress = encodeAddress(publicKey, ss58Format);
@@ -389,7 +389,6 @@ async function simulateSequentialTransactionsInternal(
       let fee = '0';
       if (extrinsicForFee) {
         try {
-          const { encodeAddress, decodeAddress } = await import('@polkadot/util-crypto');
           const publicKey = decodeAddress(item.senderAddress);
           const ss58Format = api.registry.chainSS58 || 0;
           const encodedSender = encodeAddress(publicKey, ss58Format);
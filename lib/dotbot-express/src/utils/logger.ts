@@ -181,6 +181,10 @@ function createApiInitShortener(
   
   /** Returns '' when message was handled (suppress raw line), null to pass through */
   return (message: string): string | null => {
+    // Every console line goes through here; skip the regex work for anything that isn't Polkadot noise
+    if (!message.includes('API/INIT:') && !message.includes('REGISTRY:')) {
+      return null;
+    }
     const cleaned = cleanMessage(message);
     
     if (handleRpcMethodsMessage(cleaned, messages, showRpcSummary)) {
@@ -326,6 +330,9 @@ const shouldUsePretty = process.env.LOG_FORMAT !== 'json';
 // Default to false (completely excluded) - set LOG_SHOW_METADATA=true to include them
 const showMetadata = process.env.LOG_SHOW_METADATA === 'true' || process.env.LOG_SHOW_METADATA === '1';
 
+// Fields stripped from every log line when metadata is hidden
+const METADATA_FIELDS = ['service', 'version', 'environment', 'userAgent', 'subsystem', 'endpoint', 'chain'] as const;
+
 // Build ignore list for pino-pretty (only pid and hostname, since metadata is excluded from base)
 const ignoreFields = 'pid,hostname';
 
@@ -345,14 +352,12 @@ const loggerConfig: pino.LoggerOptions = {
     // Filter out metadata fields when LOG_SHOW_METADATA is disabled
     log(object: any) {
       if (!showMetadata) {
-        // Remove metadata fields when LOG_SHOW_METADATA is disabled
-        delete object.service;
-        delete object.version;
-        delete object.environment;
-        delete object.userAgent;
-        delete object.subsystem;
-        delete object.endpoint;
-        delete object.chain;
+        // Remove metadata fields when LOG_SHOW_METADATA is disabled (only those present; delete is slow)
+        for (const field of METADATA_FIELDS) {
+          if (field in object) {
+            delete object[field];
+          }
+        }
       }
       return object;
     },